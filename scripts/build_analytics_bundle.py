@@ -0,0 +1,138 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+
+from eval_records import GRADES, load_evaluation_set, tally_grades
+from generate_academic_benchmarks import DEFAULT_INPUT, metrics_from_evaluations
+from scoring_schemes import count_matrix, get_schemes, score_matrix
+
+DEFAULT_OUTPUT_DIR = "public/analytics"
+BUNDLE_VERSION = 1
+
+# Dashboard field names for each grade, as used in AnalyticsDashboard.tsx
+GRADE_KEYS = {'correct': 'correct', 'somewhat correct': 'somewhat', 'wrong': 'wrong', 'no answer': 'noAnswer'}
+
+def _pct(n, total):
+    return round(n / max(total, 1) * 100, 1)
+
+def model_summaries(benchmarks, results):
+    """Per-model leaderboard rows for the dashboard's published snapshot, sorted by LBAS."""
+    rows = []
+    for b in benchmarks:
+        r = results[b['Model']]
+        rows.append({
+            'name': b['Model'],
+            'LCT': round(b['LCT (%)'], 1),
+            'ECHR': round(b['ECHR (%)'], 1),
+            'SGG': round(b['SGG (%)'], 1),
+            'ACR': round(b['ACR (%)'], 1),
+            'RawNetScore': round(b['Raw Net Score'], 1),
+            'LBAS': round(b['LBAS Score'], 1),
+            'correct': r['correct'],
+            'somewhat': r['somewhat correct'],
+            'wrong': r['wrong'],
+            'noAnswer': r['no answer'],
+            'totalGraded': r['total']
+        })
+    return rows
+
+def batch_tallies(data):
+    """(batch, per-model grade tally) for every batch, shared by the batch and category shards."""
+    return [(batch, tally_grades(batch.graded(), data.models)) for batch in data.batches]
+
+def batch_summaries(data, tallies):
+    """Per-batch grade counts and LBAS for every model."""
+    lbas = get_schemes(['lbas'])
+    out = []
+    for batch, tally in tallies:
+        scores = score_matrix(count_matrix(tally, data.models), lbas)
+        models = {}
+        for i, m in enumerate(data.models):
+            r = tally[m]
+            row = {GRADE_KEYS[g]: r[g] for g in GRADES}
+            row['total'] = r['total']
+            row['LCT'] = _pct(r['correct'], r['total'])
+            row['LBAS'] = round(float(scores[i, 0]), 1)
+            models[m] = row
+        out.append({'batchId': batch.batch_id, 'questions': len(batch.questions), 'models': models})
+    return out
+
+def category_summaries(data, tallies):
+    """Per-grade-category totals broken down by model and by batch."""
+    out = []
+    for g in GRADES:
+        by_batch = {str(batch.batch_id): sum(t[g] for t in tally.values()) for batch, tally in tallies}
+        by_model = {m: sum(tally[m][g] for _, tally in tallies) for m in data.models}
+        out.append({'grade': g, 'total': sum(by_batch.values()), 'byModel': by_model, 'byBatch': by_batch})
+    return out
+
+def scheme_scores(results, models):
+    schemes = get_schemes()
+    scores = score_matrix(count_matrix(results, models), schemes)
+    return {
+        'schemes': [{'name': s.name, 'weights': dict(zip(GRADES, s.weights)), 'normalization': s.normalization} for s in schemes],
+        'scores': {m: {s.name: round(float(v), 1) for s, v in zip(schemes, scores[i])} for i, m in enumerate(models)}
+    }
+
+def write_shard(output_dir, name, payload, gzip_copy=False):
+    """Write one minified shard and return its manifest entry."""
+    path = f"{name}.json"
+    raw = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    full = os.path.join(output_dir, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, 'wb') as f:
+        f.write(raw)
+    # Truncated SHA-256, enough to bust caches when a shard's content changes
+    entry = {'path': path, 'bytes': len(raw), 'hash': hashlib.sha256(raw).hexdigest()[:16]}
+    if gzip_copy:
+        # mtime=0 keeps the .gz byte-identical across rebuilds
+        packed = gzip.compress(raw, compresslevel=9, mtime=0)
+        with open(full + '.gz', 'wb') as f:
+            f.write(packed)
+        entry['gzipBytes'] = len(packed)
+    return entry
+
+def build_bundle(json_file_path=DEFAULT_INPUT, output_dir=DEFAULT_OUTPUT_DIR, gzip_copy=False):
+    print("Loading evaluation data...")
+    data = load_evaluation_set(json_file_path)
+    benchmarks, results = metrics_from_evaluations(data)
+    tallies = batch_tallies(data)
+
+    shards = {
+        'models': model_summaries(benchmarks, results),
+        'batches': batch_summaries(data, tallies),
+        'categories': category_summaries(data, tallies),
+        'schemes': scheme_scores(results, data.models)
+    }
+
+    print(f"Writing analytics bundle to '{output_dir}'...")
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {
+        'version': BUNDLE_VERSION,
+        'source': os.path.basename(json_file_path),
+        'sourceTimestamp': data.timestamp,
+        'models': list(data.models),
+        'grades': list(GRADES),
+        'batches': [{'batchId': b.batch_id, 'questions': len(b.questions)} for b in data.batches],
+        'shards': {name: write_shard(output_dir, name, payload, gzip_copy) for name, payload in shards.items()}
+    }
+    with open(os.path.join(output_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    total = sum(s['bytes'] for s in manifest['shards'].values())
+    print(f"Wrote {len(shards)} shards ({total} bytes) plus manifest.json")
+    return manifest
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-aggregate the evaluation export into static dashboard shards.")
+    parser.add_argument('-i', '--input', default=DEFAULT_INPUT, help="evaluation export JSON")
+    parser.add_argument('-o', '--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--gzip', action='store_true', help="also write precompressed .json.gz copies")
+    args = parser.parse_args()
+
+    if os.path.exists(args.input):
+        build_bundle(args.input, args.output_dir, args.gzip)
+    else:
+        print(f"Error: Could not find {args.input}")
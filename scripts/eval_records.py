@@ -0,0 +1,244 @@
+import json
+from sys import intern
+
+# Grades used by the evaluation export; anything else is counted as 'no answer'
+GRADES = ('correct', 'somewhat correct', 'wrong', 'no answer')
+
+def grade_bucket(grade):
+    """The GRADES entry an evaluation counts under; ungraded or unknown grades are 'no answer'."""
+    return grade if grade in GRADES else 'no answer'
+
+def tally_grades(evaluations, models):
+    """
+    Per-model grade counts plus 'total' for each of `models`.
+    Evaluations of models outside `models` are ignored.
+    """
+    results = {m: dict.fromkeys(GRADES + ('total',), 0) for m in models}
+    for ev in evaluations:
+        r = results.get(ev.model)
+        if r is not None:
+            r[grade_bucket(ev.grade)] += 1
+            r['total'] += 1
+    return results
+
+def _intern(s):
+    return intern(s) if isinstance(s, str) else s
+
+def _split(d, required, optional, where):
+    """
+    Pull the modelled keys out of one JSON object. Missing required keys raise;
+    every other key (including an optional key set to null) is returned in
+    `extra` so it can be written back unchanged.
+    """
+    if not isinstance(d, dict):
+        raise ValueError(f"{where}: expected an object, got {type(d).__name__}")
+    missing = [k for k in required if k not in d]
+    if missing:
+        raise ValueError(f"{where}: missing required key(s) {', '.join(missing)}")
+    values = {k: d[k] for k in required}
+    extra = {}
+    for k, v in d.items():
+        if k in values:
+            continue
+        if k in optional and v is not None:
+            values[k] = v
+        else:
+            extra[k] = v
+    return values, extra or None
+
+def _with_extra(d, extra):
+    if extra:
+        d.update(extra)
+    return d
+
+class Evaluation:
+    """One model's answer to one question, with its grade once graded."""
+    __slots__ = ('model', 'answer', 'grade', 'author', 'extra')
+
+    def __init__(self, model, answer, grade=None, author=None, extra=None):
+        self.model = intern(model)
+        self.answer = answer
+        self.grade = _intern(grade)
+        self.author = _intern(author)
+        self.extra = extra
+
+    def __repr__(self):
+        return f"Evaluation({self.model!r}, {self.answer!r}, {self.grade!r})"
+
+    @classmethod
+    def from_json(cls, model, d, where="evaluation"):
+        v, extra = _split(d, ('answer', 'evaluation'), ('author',), where)
+        return cls(model, v['answer'], v['evaluation'], v.get('author'), extra)
+
+    def to_json(self):
+        d = {'answer': self.answer, 'evaluation': self.grade}
+        if self.author is not None:
+            d['author'] = self.author
+        return _with_extra(d, self.extra)
+
+class Question:
+    """
+    A question slot in a batch. `text` is None for answer slots past the last
+    parsed question, so batches with short question lists stay lossless.
+    `evaluations` is aligned with the owning batch's `models`; models that did
+    not answer this slot hold None. `order` holds this question's own key order
+    as batch positions, only when it differs from the batch order.
+    """
+    __slots__ = ('index', 'text', 'evaluations', 'extra', 'order')
+
+    def __init__(self, index, text, evaluations=None, extra=None, order=None):
+        self.index = index
+        self.text = text
+        self.evaluations = evaluations if evaluations is not None else []
+        self.extra = extra
+        self.order = order
+
+    def __repr__(self):
+        return f"Question({self.index}, {self.text!r}, {len(self.graded())} evaluations)"
+
+    def graded(self):
+        return [ev for ev in self.evaluations if ev is not None]
+
+    def in_source_order(self):
+        """Evaluations in the key order they had in the source JSON."""
+        if self.order is None:
+            return self.graded()
+        return [self.evaluations[pos] for pos in self.order]
+
+    def evaluation(self, model):
+        for ev in self.evaluations:
+            if ev is not None and ev.model == model:
+                return ev
+        return None
+
+class Batch:
+    __slots__ = ('batch_id', 'questions', 'models', 'positions', 'extra')
+
+    def __init__(self, batch_id, questions=None, models=(), extra=None):
+        self.batch_id = batch_id
+        self.questions = questions if questions is not None else []
+        # Model order of the source JSON, kept so dict key order round-trips
+        self.models = tuple(intern(m) for m in models)
+        self.positions = {m: i for i, m in enumerate(self.models)}
+        self.extra = extra
+
+    def __repr__(self):
+        return f"Batch({self.batch_id}, {len(self.questions)} questions)"
+
+    def evaluation(self, question_index, model):
+        """Evaluation of one model on the question at position `question_index`, or None."""
+        pos = self.positions.get(model)
+        if pos is None or question_index >= len(self.questions):
+            return None
+        return self.questions[question_index].evaluations[pos]
+
+    def graded(self):
+        for q in self.questions:
+            yield from q.graded()
+
+    def answers(self, model):
+        """Answers of one model in question order, as in `modelAnswers`."""
+        pos = self.positions[model]
+        return [q.evaluations[pos].answer for q in self.questions if q.evaluations[pos] is not None]
+
+    # --- parsed schema: {"batchId", "questions": [str], "modelAnswers": {model: [str]}} ---
+
+    @classmethod
+    def from_parsed(cls, batch_id, questions, model_answers, extra=None):
+        models = list(model_answers)
+        n = max([len(questions)] + [len(a) for a in model_answers.values()])
+        qs = [Question(i, questions[i] if i < len(questions) else None, [None] * len(models)) for i in range(n)]
+        for pos, model in enumerate(models):
+            model = intern(model)
+            for i, ans in enumerate(model_answers[model]):
+                qs[i].evaluations[pos] = Evaluation(model, ans)
+        return cls(batch_id, qs, models, extra)
+
+    @classmethod
+    def from_parsed_json(cls, d):
+        v, extra = _split(d, ('batchId', 'questions', 'modelAnswers'), (), "parsed batch")
+        return cls.from_parsed(v['batchId'], v['questions'], v['modelAnswers'], extra)
+
+    def to_parsed_json(self):
+        return _with_extra({
+            "batchId": self.batch_id,
+            "questions": [q.text for q in self.questions if q.text is not None],
+            "modelAnswers": {m: self.answers(m) for m in self.models}
+        }, self.extra)
+
+    # --- export schema: {"batchId", "questions": [{"questionIndex", "questionText", "evaluations"}]} ---
+
+    @classmethod
+    def from_export_json(cls, d):
+        v, extra = _split(d, ('batchId', 'questions'), (), "batch")
+        where = f"batch {v['batchId']}"
+        raw = [_split(q, ('questionIndex', 'questionText', 'evaluations'), (), f"{where} question {i}")
+               for i, q in enumerate(v['questions'])]
+
+        models = {}
+        for qv, _ in raw:
+            for model in qv['evaluations']:
+                models.setdefault(intern(model), len(models))
+
+        qs = []
+        for qv, q_extra in raw:
+            evs = [None] * len(models)
+            order = [models[model] for model in qv['evaluations']]
+            for model, e in qv['evaluations'].items():
+                evs[models[model]] = Evaluation.from_json(model, e, f"{where} question {qv['questionIndex']} {model}")
+            # Only questions that list models out of batch order pay for storing it
+            order = tuple(order) if order != sorted(order) else None
+            qs.append(Question(qv['questionIndex'], qv['questionText'], evs, q_extra, order))
+        return cls(v['batchId'], qs, models, extra)
+
+    def to_export_json(self):
+        return _with_extra({
+            "batchId": self.batch_id,
+            "questions": [_with_extra({
+                "questionIndex": q.index,
+                "questionText": q.text,
+                "evaluations": {ev.model: ev.to_json() for ev in q.in_source_order()}
+            }, q.extra) for q in self.questions]
+        }, self.extra)
+
+class EvaluationSet:
+    """The evaluation export: graded batches plus the model roster."""
+    __slots__ = ('timestamp', 'models', 'batches', 'extra')
+
+    def __init__(self, models, batches, timestamp=None, extra=None):
+        self.timestamp = timestamp
+        self.models = tuple(intern(m) for m in models)
+        self.batches = batches
+        self.extra = extra
+
+    def __repr__(self):
+        return f"EvaluationSet({len(self.models)} models, {len(self.batches)} batches)"
+
+    def evaluations(self):
+        for b in self.batches:
+            yield from b.graded()
+
+    @classmethod
+    def from_json(cls, d):
+        v, extra = _split(d, ('models', 'batches'), ('timestamp',), "evaluation export")
+        return cls(v['models'], [Batch.from_export_json(b) for b in v['batches']], v.get('timestamp'), extra)
+
+    def to_json(self):
+        d = {}
+        if self.timestamp is not None:
+            d['timestamp'] = self.timestamp
+        d['models'] = list(self.models)
+        d['batches'] = [b.to_export_json() for b in self.batches]
+        return _with_extra(d, self.extra)
+
+def load_evaluation_set(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return EvaluationSet.from_json(json.load(f))
+
+def load_parsed_batches(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [Batch.from_parsed_json(b) for b in json.load(f)]
+
+def dump_parsed_batches(batches, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([b.to_parsed_json() for b in batches], f, indent=2)
@@ -0,0 +1,240 @@
+import argparse
+import os
+import random
+import time
+
+from eval_records import load_evaluation_set
+from generate_academic_benchmarks import DEFAULT_INPUT, format_metrics_table
+from parse_exact_files import MODELS, NO_ANSWER, parse_batch_text
+
+ANSWERS_PER_MODEL = 20
+
+# Expected: slots with a real expected answer (the recall denominator).
+# Padded: every slot the extractor filled with NO_ANSWER, whatever was expected.
+# Pad Expected: slots whose expected answer is itself NO_ANSWER; reported, not scored.
+HARNESS_COLUMNS = ['Model', 'Expected', 'Matched', 'Padded', 'Pad Expected', 'Recall (%)']
+
+def _tally(models):
+    return {m: {'Model': m, 'Expected': 0, 'Matched': 0, 'Padded': 0, 'Pad Expected': 0} for m in models}
+
+def _finish(tally):
+    rows = list(tally.values())
+    for r in rows:
+        r['Recall (%)'] = r['Matched'] / max(r['Expected'], 1) * 100
+    return rows
+
+def _timed_parse(texts, repeat):
+    """Parse every (batch_id, text) `repeat` times; return the last parse and the best wall time of one pass."""
+    best = float('inf')
+    parsed = None
+    for _ in range(max(repeat, 1)):
+        t0 = time.perf_counter()
+        parsed = [parse_batch_text(text, batch_id) for batch_id, text in texts]
+        best = min(best, time.perf_counter() - t0)
+    return parsed, best
+
+def compare(parsed, expected, tally, mismatches, limit=10):
+    """
+    Check each parsed answer against its expected answer.
+    `expected` maps batch_id -> [(question_index, model, answer)].
+    """
+    by_id = {b.batch_id: b for b in parsed}
+    for batch_id, answers in expected.items():
+        batch = by_id.get(batch_id)
+        for q_idx, model, want in answers:
+            r = tally.get(model)
+            if r is None:
+                continue
+            ev = batch.evaluation(q_idx, model) if batch is not None else None
+            got = ev.answer if ev is not None else None
+            if got == NO_ANSWER:
+                r['Padded'] += 1
+            if want == NO_ANSWER:
+                r['Pad Expected'] += 1
+            else:
+                r['Expected'] += 1
+                if got == want:
+                    r['Matched'] += 1
+            if got != want and len(mismatches) < limit:
+                mismatches.append((batch_id, q_idx, model, want, got))
+
+def _check(texts, expected, models, repeat):
+    parsed, elapsed = _timed_parse(texts, repeat)
+    tally = _tally(models)
+    mismatches = []
+    compare(parsed, expected, tally, mismatches)
+    return _finish(tally), mismatches, elapsed
+
+def golden_check(golden_path, batch_dir=".", repeat=5):
+    """Re-parse the batch-*.txt transcripts and compare with the graded export's answers."""
+    golden = load_evaluation_set(golden_path)
+    texts = []
+    expected = {}
+    for batch in golden.batches:
+        filename = os.path.join(batch_dir, f'batch-{batch.batch_id}.txt')
+        if not os.path.exists(filename):
+            print(f"File {filename} not found.")
+            continue
+        with open(filename, 'r', encoding='utf-8') as f:
+            texts.append((batch.batch_id, f.read()))
+        expected[batch.batch_id] = [(q.index, ev.model, ev.answer) for q in batch.questions for ev in q.graded()]
+    return _check(texts, expected, golden.models, repeat)
+
+# --- synthetic transcripts ---
+
+_TOPICS = [
+    "Punishment of murder", "Cheating and dishonest inducement", "Theft of movable property",
+    "Criminal breach of trust", "Voluntarily causing grievous hurt", "Wrongful confinement",
+    "Organised crime", "Snatching", "Mischief causing damage", "Criminal intimidation"
+]
+_SUFFIXES = ['', '', '(1)', '(2)', '(3)(a)', 'A']
+_FILLER = [
+    "the provision replaces the corresponding clause of the old code",
+    "courts have read this together with the general exceptions",
+    "punishment may extend to imprisonment and fine",
+    "see also the explanation appended to the clause",
+    "the offence is cognizable and non-bailable in most cases"
+]
+
+# Layouts, each aimed at one branch of extract_20_answers:
+#   numbered / paren / bullet - the numbered and bullet regexes
+#   wrapped                   - numbered items spread over several lines
+#   table                     - Claude-style '# Offence' / '# ... Query' headers over unnumbered
+#                               rows, so an unstripped header shifts every answer
+#   paragraph                 - Meta AI-style run-on sentences (sentence splitting)
+#   merged                    - unnumbered answers wrapped over two lines (the merge heuristic)
+#   plain                     - one unnumbered answer per line (line splitting)
+LAYOUTS = ('numbered', 'paren', 'bullet', 'wrapped', 'table', 'paragraph', 'merged', 'plain')
+
+def _answer(rng):
+    return f"Section {rng.randint(1, 358)}{rng.choice(_SUFFIXES)}"
+
+def synthetic_section(rng, layout, answers, filler_lines=0):
+    """
+    Lines of one model section answering with `answers` in `layout`. `filler_lines`
+    adds that many lines of commentary under each numbered item.
+    """
+    lines = []
+    if layout == 'table':
+        lines += ["# Offence\tBNS Section", "# Legal Query Responses"]
+    if layout == 'paragraph':
+        return [' '.join(f"{rng.choice(_TOPICS)} falls under {a} BNS." for a in answers)]
+    for n, a in enumerate(answers, 1):
+        topic = rng.choice(_TOPICS)
+        if layout == 'numbered':
+            lines.append(f"{n}. {topic} — {a} BNS.")
+        elif layout == 'table':
+            lines.append(f"{topic}\t{a} BNS")
+        elif layout == 'paren':
+            lines.append(f"{n}) {topic} — {a} BNS.")
+        elif layout == 'bullet':
+            lines.append(f"• {topic} — {a} BNS.")
+        elif layout == 'wrapped':
+            lines += [f"{n}. {topic}", f"   — {a} BNS,", f"   {rng.choice(_FILLER)}."]
+        elif layout == 'merged':
+            lines += [f"{topic} is punishable", f"under {a} BNS."]
+        else:
+            lines.append(f"{topic} — {a} BNS.")
+        if layout in ('numbered', 'paren', 'wrapped'):
+            lines += [f"   {rng.choice(_FILLER)}." for _ in range(filler_lines)]
+    return lines
+
+def synthetic_batch(rng, batch_id, models=MODELS, drop_rate=0.25):
+    """
+    One transcript in the batch-*.txt layout, with each model section in a random
+    layout. With probability `drop_rate` a section omits 1-4 answers; the extractor
+    should then return the remaining answers in order and pad the tail.
+    Returns the text and its expected answers.
+    """
+    lines = [f"Batch {batch_id}({ANSWERS_PER_MODEL * (batch_id - 1) + 1}-{ANSWERS_PER_MODEL * batch_id}):"]
+    for i in range(ANSWERS_PER_MODEL):
+        lines.append(f"{i + 1}.\tUnder the BNS, which section covers {rng.choice(_TOPICS).lower()} (case {i + 1})?")
+    lines.append("")
+
+    expected = []
+    for model in models:
+        answers = [_answer(rng) for _ in range(ANSWERS_PER_MODEL)]
+        if rng.random() < drop_rate:
+            for i in sorted(rng.sample(range(ANSWERS_PER_MODEL), rng.randint(1, 4)), reverse=True):
+                del answers[i]
+        lines.append(model)
+        lines += synthetic_section(rng, rng.choice(LAYOUTS), answers)
+        lines.append("")
+        padded = answers + [NO_ANSWER] * (ANSWERS_PER_MODEL - len(answers))
+        expected += [(i, model, a) for i, a in enumerate(padded)]
+    return '\n'.join(lines), expected
+
+def fuzz_check(batches=200, seed=0, repeat=1):
+    """Extraction correctness and speed on `batches` generated transcripts."""
+    rng = random.Random(seed)
+    texts = []
+    expected = {}
+    for batch_id in range(1, batches + 1):
+        text, answers = synthetic_batch(rng, batch_id)
+        texts.append((batch_id, text))
+        expected[batch_id] = answers
+    return _check(texts, expected, MODELS, repeat)
+
+def long_check(filler_lines=250, seed=0, repeat=1):
+    """
+    One scaled-up transcript: every model section carries `filler_lines` lines of
+    commentary under each answer, so the regexes run over sections thousands of
+    lines long.
+    """
+    rng = random.Random(seed)
+    layouts = ('numbered', 'paren', 'wrapped')
+    lines = [f"Batch 1(1-{ANSWERS_PER_MODEL}):"]
+    lines += [f"{i + 1}.\tUnder the BNS, which section covers case {i + 1}?" for i in range(ANSWERS_PER_MODEL)]
+    lines.append("")
+    expected = []
+    for n, model in enumerate(MODELS):
+        answers = [_answer(rng) for _ in range(ANSWERS_PER_MODEL)]
+        lines.append(model)
+        lines += synthetic_section(rng, layouts[n % len(layouts)], answers, filler_lines)
+        lines.append("")
+        expected += [(i, model, a) for i, a in enumerate(answers)]
+    text = '\n'.join(lines)
+    print(f"\nLong transcript: {text.count(chr(10)) + 1:,} lines, {len(text):,} chars")
+    return _check([(1, text)], {1: expected}, MODELS, repeat)
+
+def report(title, rows, mismatches, elapsed):
+    expected = sum(r['Expected'] for r in rows)
+    matched = sum(r['Matched'] for r in rows)
+    padded = sum(r['Padded'] for r in rows)
+    slots = expected + sum(r['Pad Expected'] for r in rows)
+    print(f"\n--- {title} ---")
+    print(format_metrics_table(rows, HARNESS_COLUMNS))
+    print(f"\nOverall recall: {matched}/{expected} ({matched / max(expected, 1) * 100:.2f}%), {padded} slots padded")
+    print(f"Throughput: {slots / max(elapsed, 1e-9):,.0f} answers/s ({elapsed * 1000:.1f} ms per pass)")
+    for batch_id, q_idx, model, want, got in mismatches:
+        print(f"  batch {batch_id} Q{q_idx + 1} {model}: expected {want!r}, got {got!r}")
+    return matched / max(expected, 1) * 100
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answer-extraction recall and throughput regression harness.")
+    parser.add_argument('-i', '--input', default=DEFAULT_INPUT, help="graded export with the golden answers")
+    parser.add_argument('--batch-dir', default=".", help="directory holding batch-*.txt")
+    parser.add_argument('--repeat', type=int, default=5, help="timed passes over the real transcripts (best is reported)")
+    parser.add_argument('--fuzz-batches', type=int, default=200, help="synthetic transcripts to generate (0 to skip)")
+    parser.add_argument('--long-lines', type=int, default=250,
+                        help="commentary lines per answer in the long transcript (0 to skip)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--min-recall', type=float, default=100.0, help="fail when overall recall (%%) drops below this")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.input):
+        print(f"Error: Could not find {args.input}")
+        raise SystemExit(1)
+
+    recalls = [report("Golden Transcripts", *golden_check(args.input, args.batch_dir, args.repeat))]
+    if args.fuzz_batches > 0:
+        recalls.append(report(f"Synthetic Transcripts ({args.fuzz_batches} batches, seed {args.seed})",
+                              *fuzz_check(args.fuzz_batches, args.seed)))
+    if args.long_lines > 0:
+        recalls.append(report(f"Long Transcript ({args.long_lines} lines per answer, seed {args.seed})",
+                              *long_check(args.long_lines, args.seed)))
+
+    if min(recalls) < args.min_recall:
+        print(f"\nFAIL: recall {min(recalls):.2f}% is below {args.min_recall:.2f}%")
+        raise SystemExit(1)
+    print("\nPASS")
@@ -1,40 +1,56 @@
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
+import argparse
+import csv
 import os
 from math import pi
 
-# Set style for academic papers
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_context("paper", font_scale=1.2)
-sns.set_palette("deep")
+from eval_records import load_evaluation_set, tally_grades
+from scoring_schemes import NORMALIZATIONS, SCHEMES, count_matrix, get_schemes, grade_counts, score_matrix, sweep_schemes
+
+DEFAULT_INPUT = "bns_eval_results_complete_1771940199597.json"
+DEFAULT_CSV = "benchmark_metrics_table.csv"
+
+METRIC_COLUMNS = ['Model', 'LCT (%)', 'ECHR (%)', 'SGG (%)', 'ACR (%)', 'Raw Net Score', 'LBAS Score', 'Total Graded']
+
+_plotting = None
+
+def load_plotting_stack():
+    """
+    Import matplotlib, seaborn and numpy on first use and apply the academic style.
+    Kept out of module import so `metrics` and `csv` start without the plotting stack.
+    """
+    global _plotting
+    if _plotting is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        import numpy as np
+
+        # Set style for academic papers
+        plt.style.use('seaborn-v0_8-whitegrid')
+        sns.set_context("paper", font_scale=1.2)
+        sns.set_palette("deep")
+        _plotting = (plt, np)
+    return _plotting
+
+def to_dataframe(benchmarks):
+    import pandas as pd
+    return pd.DataFrame(benchmarks, columns=METRIC_COLUMNS)
 
 def calculate_metrics(json_file_path):
     print("Loading evaluation data...")
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    models = data['models']
-    
-    # Initialize metric tracking
-    results = {m: {'correct': 0, 'somewhat correct': 0, 'wrong': 0, 'no answer': 0, 'total': 0} for m in models}
-
-    # Parse JSON
-    for batch in data['batches']:
-        for question in batch['questions']:
-            for model, eval_data in question['evaluations'].items():
-                if model in results:
-                    grade = eval_data.get('evaluation')
-                    if grade in results[model]:
-                        results[model][grade] += 1
-                        results[model]['total'] += 1
-                    else:
-                        results[model]['no answer'] += 1
-                        results[model]['total'] += 1
+    return metrics_from_evaluations(load_evaluation_set(json_file_path))
+
+def metrics_from_evaluations(data):
+    models = data.models
+    
+    results = tally_grades(data.evaluations(), models)
                         
     benchmarks = []
+
+    # Raw LBAS ('net') shows why heavy hallucinators clamp to 0 ('lbas').
+    # Scored per model in pure Python so this path never imports numpy.
+    net, lbas_scheme = get_schemes(['net', 'lbas'])
     
     for m in models:
         r = results[m]
@@ -44,10 +60,8 @@ def calculate_metrics(json_file_path):
         echr = (r['wrong'] / total) * 100
         sgg = (r['somewhat correct'] / total) * 100
         acr = (r['no answer'] / total) * 100
-        
-        # Raw LBAS to show why it's 0
-        raw_lbas = (r['correct'] * 1.0) + (r['somewhat correct'] * 0.5) + (r['no answer'] * 0) + (r['wrong'] * -1.0)
-        lbas = max(0, min(100, (raw_lbas / total) * 100))
+        counts = grade_counts(r)
+        raw_lbas, lbas = net.score(counts), lbas_scheme.score(counts)
         
         benchmarks.append({
             'Model': m,
@@ -55,20 +69,47 @@ def calculate_metrics(json_file_path):
             'ECHR (%)': echr,
             'SGG (%)': sgg,
             'ACR (%)': acr,
-            'Raw Net Score': (raw_lbas / total) * 100,
+            'Raw Net Score': raw_lbas,
             'LBAS Score': lbas,
             'Total Graded': total
         })
         
-    df = pd.DataFrame(benchmarks)
-    df = df.sort_values(by='LBAS Score', ascending=False).reset_index(drop=True)
-    return df, results
+    # Stable sort keeps the input model order for ties, matching the old DataFrame sort
+    benchmarks.sort(key=lambda row: row['LBAS Score'], reverse=True)
+    return benchmarks, results
+
+def scheme_sensitivity(raw_results, schemes):
+    """One row per model with its score under every scheme, from a single score_matrix call."""
+    models = list(raw_results)
+    scores = score_matrix(count_matrix(raw_results, models), schemes)
+    rows = []
+    for i, m in enumerate(models):
+        row = {'Model': m}
+        row.update({s.name: float(v) for s, v in zip(schemes, scores[i])})
+        rows.append(row)
+    return rows
+
+def format_metrics_table(benchmarks, columns=METRIC_COLUMNS):
+    """Render the metrics rows as a right-aligned plain-text table."""
+    cells = [[str(round(row[c], 6)) if isinstance(row[c], float) else str(row[c]) for c in columns] for row in benchmarks]
+    widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+    lines = [' '.join(c.rjust(w) for c, w in zip(columns, widths))]
+    for r in cells:
+        lines.append(' '.join(v.rjust(w) for v, w in zip(r, widths)))
+    return '\n'.join(lines)
+
+def write_metrics_csv(benchmarks, csv_path=DEFAULT_CSV, columns=METRIC_COLUMNS):
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(benchmarks)
 
 def generate_diverging_bar_chart(df, raw_results, output_dir="charts"):
     """
     Diverging bar chart shows Truthful (Positive) vs Hallucinated (Negative).
     This visually explains why heavily hallucinating models score 0.
     """
+    plt, np = load_plotting_stack()
     fig, ax = plt.subplots(figsize=(12, 7))
     models = df['Model'].tolist()
     
@@ -105,6 +146,7 @@ def generate_radar_chart(df, output_dir="charts"):
     Radar chart to compare multiple dimensions for the top models.
     Styled for IEEE publication standards.
     """
+    plt, np = load_plotting_stack()
     top_models = df.head(4) # Only take top 4 to prevent clutter
     
     metrics = ['LCT (%)', 'SGG (%)', 'ACR (%)', 'Inverse_ECHR']
@@ -169,6 +211,7 @@ def generate_grouped_bar_chart(df, output_dir="charts"):
     LCT, SGG, ACR, and Safety (100 - ECHR). 
     This provides clear, readable markings compared to a radar chart.
     """
+    plt, np = load_plotting_stack()
     top_models = df.head(4)
     models = top_models['Model'].tolist()
     
@@ -219,26 +262,79 @@ def generate_grouped_bar_chart(df, output_dir="charts"):
     plt.savefig(f"{output_dir}/fig2_grouped_competency.png", dpi=300, bbox_inches='tight', facecolor='white')
     plt.close()
 
-def generate_ieee_visualizations(df, raw_results, output_dir="charts"):
+def generate_ieee_visualizations(benchmarks, raw_results, output_dir="charts"):
     print(f"Generating charts in '{output_dir}' directory...")
     os.makedirs(output_dir, exist_ok=True)
-    
+
+    df = to_dataframe(benchmarks)
     generate_diverging_bar_chart(df, raw_results, output_dir)
     generate_grouped_bar_chart(df, output_dir)
 
     print("Charts generated successfully!")
 
-if __name__ == "__main__":
-    file_path = "bns_eval_results_complete_1771940199597.json"
-    
-    if os.path.exists(file_path):
-        df, raw = calculate_metrics(file_path)
+def build_parser():
+    parser = argparse.ArgumentParser(description="LBAS academic benchmark metrics, CSV export and IEEE charts.")
+    parser.add_argument('-i', '--input', default=DEFAULT_INPUT, help="evaluation export JSON")
+    sub = parser.add_subparsers(dest='command')
+
+    sub.add_parser('metrics', help="print the metrics table only")
+
+    p_csv = sub.add_parser('csv', help="write the metrics table as CSV")
+    p_csv.add_argument('-o', '--output', default=DEFAULT_CSV)
+
+    p_charts = sub.add_parser('charts', help="render the IEEE charts (loads matplotlib)")
+    p_charts.add_argument('-o', '--output-dir', default="charts")
+
+    p_sens = sub.add_parser('sensitivity', help="score every model under many weighting schemes")
+    p_sens.add_argument('-s', '--scheme', action='append', choices=sorted(SCHEMES),
+                        help="registered scheme name (repeatable, default: all)")
+    p_sens.add_argument('--sweep', action='store_true', help="add a grid over the partial-credit, wrong and no-answer weights")
+    p_sens.add_argument('--partial', type=float, nargs='+', default=[0.0, 0.25, 0.5, 0.75, 1.0],
+                        help="sweep weights for 'somewhat correct'")
+    p_sens.add_argument('--wrong', type=float, nargs='+', default=[-2.0, -1.5, -1.0, -0.5, 0.0],
+                        help="sweep weights for 'wrong'")
+    p_sens.add_argument('--no-answer', type=float, nargs='+', default=[0.0],
+                        help="sweep weights for 'no answer'")
+    p_sens.add_argument('--normalization', choices=NORMALIZATIONS, default='clamp',
+                        help="normalization applied to the sweep schemes")
+    p_sens.add_argument('-o', '--output', help="also write the table as CSV")
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"Error: Could not find {args.input}")
+        return 1
+
+    benchmarks, raw = calculate_metrics(args.input)
+
+    if args.command in (None, 'metrics'):
         print("\n--- IEEE/Scopus Metrics Table ---")
-        print(df.to_string(index=False))
-        
-        df.to_csv("benchmark_metrics_table.csv", index=False)
-        print("\nTable saved locally as 'benchmark_metrics_table.csv'")
-        
-        generate_ieee_visualizations(df, raw)
-    else:
-        print(f"Error: Could not find {file_path}")
+        print(format_metrics_table(benchmarks))
+
+    if args.command in (None, 'csv'):
+        csv_path = getattr(args, 'output', DEFAULT_CSV)
+        write_metrics_csv(benchmarks, csv_path)
+        print(f"\nTable saved locally as '{csv_path}'")
+
+    if args.command == 'sensitivity':
+        schemes = get_schemes(args.scheme)
+        if args.sweep:
+            schemes += sweep_schemes(args.partial, args.wrong, args.no_answer, args.normalization)
+        rows = scheme_sensitivity(raw, schemes)
+        columns = ['Model'] + [s.name for s in schemes]
+        print(f"\n--- Scoring Scheme Sensitivity ({len(schemes)} schemes) ---")
+        print(format_metrics_table(rows, columns))
+        if args.output:
+            write_metrics_csv(rows, args.output, columns)
+            print(f"\nTable saved locally as '{args.output}'")
+
+    if args.command in (None, 'charts'):
+        generate_ieee_visualizations(benchmarks, raw, getattr(args, 'output_dir', "charts"))
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
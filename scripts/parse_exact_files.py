@@ -1,13 +1,17 @@
 import re
-import json
 import os
 
-def parse():
-    models = [
-        "ChatGPT 5.2", "Claude Sonnet 4.6", "Grok 4.1", 
-        "Indus Sarvam", "Gemini 3", "DeepSeek V3.2", "Kruti", "Meta AI"
-    ]
+from eval_records import Batch, dump_parsed_batches
+
+MODELS = [
+    "ChatGPT 5.2", "Claude Sonnet 4.6", "Grok 4.1", 
+    "Indus Sarvam", "Gemini 3", "DeepSeek V3.2", "Kruti", "Meta AI"
+]
 
+# Filler for answer slots the extractor could not recover
+NO_ANSWER = "No answer extracted"
+
+def parse():
     all_data = []
 
     for batch_id in range(1, 6):
@@ -19,64 +23,62 @@ def parse():
         with open(filename, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Extract Questions
-        first_model_pos = len(content)
-        for m in models:
-            pattern = r'(?im)^' + re.escape(m) + r'\s*$'
-            match = re.search(pattern, content)
-            if match and match.start() < first_model_pos:
-                first_model_pos = match.start()
-                
-        questions_text = content[:first_model_pos].strip()
-        
-        # Replace the BATCH line
-        questions_text = re.sub(r'(?i)^BATCH.*?\n', '', questions_text).strip()
-        
-        # Parse questions
-        q_lines = [q.strip() for q in questions_text.split('\n') if q.strip()]
-        questions = []
-        for line in q_lines:
-            # Only match numbering pattern exactly at the very start of the string, e.g., '1.', '2)', ' 1 '
-            q = re.sub(r'^\s*\d+[\.\)]?\s+', '', line).strip()
-            if q and len(q) > 10:
-                questions.append(q)
-                
-        if len(questions) > 20: 
-            questions = questions[:20]
-
-        # Find model sections
-        pos = []
-        for m in models:
-            for match in re.finditer(r'(?im)^' + re.escape(m) + r'\s*$', content):
-                pos.append((match.start(), match.end(), m))
-        
-        pos.sort(key=lambda x: x[0])
+        all_data.append(parse_batch_text(content, batch_id))
         
-        model_answers = {}
-        for m in models:
-            model_answers[m] = []
+    dump_parsed_batches(all_data, 'src/lib/data.json')
 
-        for i, p in enumerate(pos):
-            start = p[1]
-            end = pos[i+1][0] if i+1 < len(pos) else len(content)
-            mname = p[2]
+def parse_batch_text(content, batch_id, models=MODELS):
+    # Extract Questions
+    first_model_pos = len(content)
+    for m in models:
+        pattern = r'(?im)^' + re.escape(m) + r'\s*$'
+        match = re.search(pattern, content)
+        if match and match.start() < first_model_pos:
+            first_model_pos = match.start()
             
-            ans_text = content[start:end].strip()
-            answers = extract_20_answers(ans_text)
+    questions_text = content[:first_model_pos].strip()
+    
+    # Replace the BATCH line
+    questions_text = re.sub(r'(?i)^BATCH.*?\n', '', questions_text).strip()
+    
+    # Parse questions
+    q_lines = [q.strip() for q in questions_text.split('\n') if q.strip()]
+    questions = []
+    for line in q_lines:
+        # Only match numbering pattern exactly at the very start of the string, e.g., '1.', '2)', ' 1 '
+        q = re.sub(r'^\s*\d+[\.\)]?\s+', '', line).strip()
+        if q and len(q) > 10:
+            questions.append(q)
             
-            while len(answers) < 20:
-                answers.append("No answer extracted")
-                
-            model_answers[mname] = answers
+    if len(questions) > 20: 
+        questions = questions[:20]
+
+    # Find model sections
+    pos = []
+    for m in models:
+        for match in re.finditer(r'(?im)^' + re.escape(m) + r'\s*$', content):
+            pos.append((match.start(), match.end(), m))
+    
+    pos.sort(key=lambda x: x[0])
+    
+    model_answers = {}
+    for m in models:
+        model_answers[m] = []
+
+    for i, p in enumerate(pos):
+        start = p[1]
+        end = pos[i+1][0] if i+1 < len(pos) else len(content)
+        mname = p[2]
+        
+        ans_text = content[start:end].strip()
+        answers = extract_20_answers(ans_text)
+        
+        while len(answers) < 20:
+            answers.append(NO_ANSWER)
             
-        all_data.append({
-            "batchId": batch_id,
-            "questions": questions,
-            "modelAnswers": model_answers
-        })
+        model_answers[mname] = answers
         
-    with open('src/lib/data.json', 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, indent=2)
+    return Batch.from_parsed(batch_id, questions, model_answers)
 
 def extract_20_answers(text):
     text = re.sub(r'(?im)^# Offence.*$', '', text) # Remove Claude table headers
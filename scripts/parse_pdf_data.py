@@ -1,5 +1,6 @@
 import re
-import json
+
+from eval_records import Batch, dump_parsed_batches
 
 def parse():
     with open('extracted_text.txt', 'r', encoding='utf-8') as f:
@@ -59,14 +60,9 @@ def parse():
                 
             model_answers[mname] = answers
             
-        all_data.append({
-            "batchId": batch_id,
-            "questions": questions,
-            "modelAnswers": model_answers
-        })
+        all_data.append(Batch.from_parsed(batch_id, questions, model_answers))
         
-    with open('data.json', 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, indent=2)
+    dump_parsed_batches(all_data, 'data.json')
 
 def extract_20_answers(text):
     # Remove table headers
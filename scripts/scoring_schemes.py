@@ -0,0 +1,99 @@
+from eval_records import GRADES
+
+# How a scheme's raw per-answer mean (in percent) becomes its reported score:
+#   clamp  - clipped to 0..100 (LBAS)
+#   raw    - left as is, may go negative (Raw Net Score)
+#   minmax - rescaled so the lowest weight maps to 0 and the highest to 100
+NORMALIZATIONS = ('clamp', 'raw', 'minmax')
+
+class ScoringScheme:
+    """A weight per grade (in GRADES order) plus a normalization rule."""
+    __slots__ = ('name', 'weights', 'normalization')
+
+    def __init__(self, name, weights, normalization='clamp'):
+        if normalization not in NORMALIZATIONS:
+            raise ValueError(f"Unknown normalization '{normalization}', expected one of {NORMALIZATIONS}")
+        if len(weights) != len(GRADES):
+            raise ValueError(f"Scheme '{name}' needs {len(GRADES)} weights, got {len(weights)}")
+        self.name = name
+        self.weights = tuple(float(w) for w in weights)
+        self.normalization = normalization
+
+    def __repr__(self):
+        return f"ScoringScheme({self.name!r}, {self.weights}, {self.normalization!r})"
+
+    def score(self, counts):
+        """
+        Score one model's grade counts (in GRADES order) in pure Python. Same
+        result as a score_matrix column, without importing numpy.
+        """
+        total = max(sum(counts), 1)
+        value = sum(c * w for c, w in zip(counts, self.weights)) / total * 100
+        if self.normalization == 'clamp':
+            return max(0.0, min(100.0, value))
+        if self.normalization == 'minmax':
+            lo, hi = min(self.weights) * 100, max(self.weights) * 100
+            return (value - lo) / max(hi - lo, 1e-12) * 100
+        return value
+
+SCHEMES = {}
+
+def register_scheme(name, correct, somewhat, wrong, no_answer=0.0, normalization='clamp'):
+    scheme = ScoringScheme(name, (correct, somewhat, wrong, no_answer), normalization)
+    SCHEMES[name] = scheme
+    return scheme
+
+def get_schemes(names=None):
+    if names is None:
+        return list(SCHEMES.values())
+    missing = [n for n in names if n not in SCHEMES]
+    if missing:
+        raise KeyError(f"Unknown scoring scheme(s): {', '.join(missing)}")
+    return [SCHEMES[n] for n in names]
+
+# Legal Benchmark Accuracy Score and its unclamped net score
+register_scheme('lbas', 1.0, 0.5, -1.0, 0.0, 'clamp')
+register_scheme('net', 1.0, 0.5, -1.0, 0.0, 'raw')
+# Plain accuracy views, no penalty for hallucinations
+register_scheme('strict', 1.0, 0.0, 0.0, 0.0, 'raw')
+register_scheme('lenient', 1.0, 1.0, 0.0, 0.0, 'raw')
+
+def sweep_schemes(somewhat_weights, wrong_weights, no_answer_weights=(0.0,), normalization='clamp'):
+    """Unregistered grid of LBAS-style schemes for sensitivity analysis."""
+    return [
+        ScoringScheme(f"s{s:+g}/w{w:+g}/n{n:+g}", (1.0, s, w, n), normalization)
+        for s in somewhat_weights for w in wrong_weights for n in no_answer_weights
+    ]
+
+def grade_counts(r):
+    """One model's tally from calculate_metrics as a tuple in GRADES order."""
+    return tuple(r[g] for g in GRADES)
+
+def count_matrix(results, models):
+    """models x grades count matrix from calculate_metrics' per-model tallies."""
+    import numpy as np
+    return np.array([grade_counts(results[m]) for m in models], dtype=np.float64)
+
+def score_matrix(counts, schemes):
+    """
+    Score every model under every scheme at once: one (models x grades) @
+    (grades x schemes) product, then per-column normalization.
+    Returns a models x schemes array.
+    """
+    import numpy as np
+    counts = np.asarray(counts, dtype=np.float64)
+    weights = np.array([s.weights for s in schemes], dtype=np.float64).T
+    totals = np.maximum(counts.sum(axis=1, keepdims=True), 1.0)
+
+    scores = (counts @ weights) / totals * 100
+
+    rules = np.array([s.normalization for s in schemes])
+    clamp = rules == 'clamp'
+    if clamp.any():
+        scores[:, clamp] = np.clip(scores[:, clamp], 0.0, 100.0)
+    minmax = rules == 'minmax'
+    if minmax.any():
+        lo = weights[:, minmax].min(axis=0) * 100
+        span = np.maximum(weights[:, minmax].max(axis=0) * 100 - lo, 1e-12)
+        scores[:, minmax] = (scores[:, minmax] - lo) / span * 100
+    return scores
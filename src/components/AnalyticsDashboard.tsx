@@ -1,8 +1,9 @@
 "use client";
 
-import React, { useMemo } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import { MODELS, ALL_BATCHES } from '@/lib/data';
 import { GlobalGrades } from '@/app/page';
+import { AnalyticsManifest, AnalyticsShards, SNAPSHOT_SHARDS, loadAnalyticsManifest, loadAnalyticsShard } from '@/lib/analytics';
 import Link from 'next/link';
 import { 
   BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, ReferenceLine,
@@ -16,7 +17,50 @@ interface AnalyticsDashboardProps {
   onClose: () => void;
 }
 
+// Pre-aggregated shards from scripts/build_analytics_bundle.py; each panel renders once its shard arrives
+type Snapshot = Partial<AnalyticsShards>;
+
+const SUMMARY_COLUMNS = ['LCT', 'ECHR', 'SGG', 'ACR', 'RawNetScore', 'LBAS'] as const;
+const GRADE_COLORS: Record<string, string> = {
+  'correct': 'bg-emerald-500',
+  'somewhat correct': 'bg-blue-500',
+  'wrong': 'bg-red-500',
+  'no answer': 'bg-slate-300'
+};
+
 export default function AnalyticsDashboard({ data, isOpen, onClose }: AnalyticsDashboardProps) {
+  const [manifest, setManifest] = useState<AnalyticsManifest | null>(null);
+  const [snapshot, setSnapshot] = useState<Snapshot>({});
+
+  // The snapshot is fetched on first open; the manifest and each shard land independently,
+  // so a failed shard only leaves its own panel empty
+  useEffect(() => {
+    if (!isOpen || manifest) return;
+    let cancelled = false;
+    loadAnalyticsManifest()
+      .then((m) => { if (!cancelled) setManifest(m); })
+      .catch((err) => console.error('Analytics bundle unavailable', err));
+    return () => { cancelled = true; };
+  }, [isOpen, manifest]);
+
+  useEffect(() => {
+    if (!manifest) return;
+    let cancelled = false;
+    const loadShard = <K extends keyof AnalyticsShards>(name: K) =>
+      loadAnalyticsShard(name)
+        .then((payload) => {
+          if (cancelled) return;
+          setSnapshot((prev) => {
+            const next = { ...prev };
+            next[name] = payload;
+            return next;
+          });
+        })
+        .catch((err) => console.error(`Analytics shard '${name}' unavailable`, err));
+    SNAPSHOT_SHARDS.forEach((name) => loadShard(name));
+    return () => { cancelled = true; };
+  }, [manifest]);
+
   const metrics = useMemo(() => {
     const rawResults: Record<string, { correct: number, somewhat: number, wrong: number, noAnswer: number, total: number }> = {};
     MODELS.forEach(m => {
@@ -68,6 +112,10 @@ export default function AnalyticsDashboard({ data, isOpen, onClose }: AnalyticsD
     }).sort((a, b) => b.LBAS - a.LBAS);
   }, [data]);
 
+  const snapshotModels = manifest?.models ?? [];
+  const snapshotDate = manifest?.sourceTimestamp ? new Date(manifest.sourceTimestamp).toLocaleDateString() : null;
+  const categoryTotal = snapshot.categories?.reduce((acc, c) => acc + c.total, 0) || 1;
+
   if (!isOpen) return null;
 
   return (
@@ -81,7 +129,7 @@ export default function AnalyticsDashboard({ data, isOpen, onClose }: AnalyticsD
               <BarChart3 size={24} />
             </div>
             <div>
-              <h2 className="text-xl md:text-2xl font-bold text-slate-900 leading-tight">Live Academic Benchmarks</h2>
+              <h2 className="text-xl md:text-2xl font-bold text-slate-900 leading-tight">Academic Benchmarks</h2>
               <p className="text-xs md:text-sm text-slate-500 font-medium">BNS Legal AI Evaluation Framework</p>
             </div>
           </div>
@@ -96,6 +144,11 @@ export default function AnalyticsDashboard({ data, isOpen, onClose }: AnalyticsD
         {/* Scrollable Content */}
         <div className="flex-1 overflow-y-auto p-4 md:p-8 bg-slate-50">
           
+          <div className="flex items-center gap-2 mb-4">
+            <span className="text-[10px] font-black uppercase tracking-wider bg-emerald-100 text-emerald-700 px-2 py-1 rounded-md">Live</span>
+            <span className="text-xs text-slate-500 font-medium">Aggregated from the current grades</span>
+          </div>
+
           {/* Top Stat Cards */}
           <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mb-8">
             <div className="bg-white p-4 md:p-5 rounded-2xl border border-slate-200 shadow-sm flex flex-col gap-2 relative overflow-hidden">
@@ -271,6 +324,127 @@ export default function AnalyticsDashboard({ data, isOpen, onClose }: AnalyticsD
 
             </div>
           </div>
+
+          {/* Published Snapshot: aggregates read from the static analytics bundle */}
+          <div className="flex items-center gap-2 mt-8 mb-4">
+            <span className="text-[10px] font-black uppercase tracking-wider bg-amber-100 text-amber-700 px-2 py-1 rounded-md">Published Snapshot</span>
+            <span className="text-xs text-slate-500 font-medium">
+              {snapshotDate ? `Graded export of ${snapshotDate}, not live` : 'Loading published snapshot...'}
+            </span>
+          </div>
+
+          <div className="grid grid-cols-1 lg:grid-cols-2 gap-8">
+            {/* Published Leaderboard */}
+            <div className="bg-white p-6 rounded-2xl border border-slate-200 shadow-sm">
+              <div className="mb-4">
+                <h3 className="text-sm font-bold text-slate-900 uppercase tracking-wider mb-1">Published Leaderboard</h3>
+                <p className="text-[10px] text-slate-500 font-medium">Per-model metrics of the published export, ranked by LBAS.</p>
+              </div>
+              <div className="overflow-x-auto">
+                <table className="w-full text-xs">
+                  <thead>
+                    <tr className="text-slate-400 uppercase tracking-wider">
+                      <th className="text-left font-bold py-2 pr-4">Model</th>
+                      {SUMMARY_COLUMNS.map(col => (
+                        <th key={col} className="text-right font-bold py-2 px-2">{col}</th>
+                      ))}
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {snapshot.models?.map(m => (
+                      <tr key={m.name} className="border-t border-slate-100">
+                        <td className="py-2 pr-4 font-bold text-slate-800">{m.name}</td>
+                        {SUMMARY_COLUMNS.map(col => (
+                          <td key={col} className="py-2 px-2 text-right font-semibold text-slate-600">{m[col]}</td>
+                        ))}
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              </div>
+            </div>
+
+            {/* Per-Batch LBAS */}
+            <div className="bg-white p-6 rounded-2xl border border-slate-200 shadow-sm">
+              <div className="mb-4">
+                <h3 className="text-sm font-bold text-slate-900 uppercase tracking-wider mb-1">LBAS by Batch</h3>
+                <p className="text-[10px] text-slate-500 font-medium">Per-batch LBAS for every model, to spot batches where a model collapses.</p>
+              </div>
+              <div className="overflow-x-auto">
+                <table className="w-full text-xs">
+                  <thead>
+                    <tr className="text-slate-400 uppercase tracking-wider">
+                      <th className="text-left font-bold py-2 pr-4">Model</th>
+                      {snapshot.batches?.map(b => (
+                        <th key={b.batchId} className="text-right font-bold py-2 px-2">Batch {b.batchId}</th>
+                      ))}
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {snapshotModels.map(model => (
+                      <tr key={model} className="border-t border-slate-100">
+                        <td className="py-2 pr-4 font-bold text-slate-800">{model}</td>
+                        {snapshot.batches?.map(b => (
+                          <td key={b.batchId} className="py-2 px-2 text-right font-semibold text-slate-600">{b.models[model]?.LBAS ?? '-'}</td>
+                        ))}
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              </div>
+            </div>
+
+            {/* Grade Distribution */}
+            <div className="bg-white p-6 rounded-2xl border border-slate-200 shadow-sm">
+              <div className="mb-4">
+                <h3 className="text-sm font-bold text-slate-900 uppercase tracking-wider mb-1">Grade Distribution</h3>
+                <p className="text-[10px] text-slate-500 font-medium">Share of all graded answers in each grade category.</p>
+              </div>
+              <div className="w-full h-3 rounded-full overflow-hidden flex bg-slate-100">
+                {snapshot.categories?.map(c => (
+                  <div key={c.grade} className={GRADE_COLORS[c.grade]} style={{ width: `${(c.total / categoryTotal) * 100}%` }} />
+                ))}
+              </div>
+              <div className="flex flex-wrap gap-4 mt-3">
+                {snapshot.categories?.map(c => (
+                  <span key={c.grade} className="flex items-center gap-1.5 text-xs font-semibold text-slate-600">
+                    <span className={`w-2.5 h-2.5 rounded-full ${GRADE_COLORS[c.grade]}`} />
+                    {c.grade}: {c.total}
+                  </span>
+                ))}
+              </div>
+            </div>
+
+            {/* Scoring Scheme Sensitivity */}
+            <div className="bg-white p-6 rounded-2xl border border-slate-200 shadow-sm">
+              <div className="mb-4">
+                <h3 className="text-sm font-bold text-slate-900 uppercase tracking-wider mb-1">Scoring Scheme Sensitivity</h3>
+                <p className="text-[10px] text-slate-500 font-medium">Each model under every registered weighting scheme.</p>
+              </div>
+              <div className="overflow-x-auto">
+                <table className="w-full text-xs">
+                  <thead>
+                    <tr className="text-slate-400 uppercase tracking-wider">
+                      <th className="text-left font-bold py-2 pr-4">Model</th>
+                      {snapshot.schemes?.schemes.map(sc => (
+                        <th key={sc.name} className="text-right font-bold py-2 px-2">{sc.name}</th>
+                      ))}
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {snapshotModels.map(model => (
+                      <tr key={model} className="border-t border-slate-100">
+                        <td className="py-2 pr-4 font-bold text-slate-800">{model}</td>
+                        {snapshot.schemes?.schemes.map(sc => (
+                          <td key={sc.name} className="py-2 px-2 text-right font-semibold text-slate-600">{snapshot.schemes?.scores[model]?.[sc.name] ?? '-'}</td>
+                        ))}
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              </div>
+            </div>
+          </div>
         </div>
       </div>
     </div>
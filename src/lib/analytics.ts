@@ -0,0 +1,83 @@
+// Static pre-aggregated analytics written by scripts/build_analytics_bundle.py
+
+export const ANALYTICS_BASE = '/analytics';
+
+export interface ShardEntry {
+  path: string;
+  bytes: number;
+  hash: string;
+  gzipBytes?: number;
+}
+
+export interface AnalyticsManifest {
+  version: number;
+  source: string;
+  sourceTimestamp: string | null;
+  models: string[];
+  grades: string[];
+  batches: { batchId: number; questions: number }[];
+  shards: Record<string, ShardEntry>;
+}
+
+export interface ModelSummary {
+  name: string;
+  LCT: number;
+  ECHR: number;
+  SGG: number;
+  ACR: number;
+  RawNetScore: number;
+  LBAS: number;
+  correct: number;
+  somewhat: number;
+  wrong: number;
+  noAnswer: number;
+  totalGraded: number;
+}
+
+export interface BatchSummary {
+  batchId: number;
+  questions: number;
+  models: Record<string, { correct: number; somewhat: number; wrong: number; noAnswer: number; total: number; LCT: number; LBAS: number }>;
+}
+
+export interface CategorySummary {
+  grade: string;
+  total: number;
+  byModel: Record<string, number>;
+  byBatch: Record<string, number>;
+}
+
+export interface AnalyticsShards {
+  models: ModelSummary[];
+  batches: BatchSummary[];
+  categories: CategorySummary[];
+  schemes: {
+    schemes: { name: string; weights: Record<string, number>; normalization: string }[];
+    scores: Record<string, Record<string, number>>;
+  };
+}
+
+export const SNAPSHOT_SHARDS: (keyof AnalyticsShards)[] = ['models', 'batches', 'categories', 'schemes'];
+
+let manifestPromise: Promise<AnalyticsManifest> | null = null;
+
+export function loadAnalyticsManifest(): Promise<AnalyticsManifest> {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${ANALYTICS_BASE}/manifest.json`).then((res) => {
+      if (!res.ok) throw new Error(`Analytics manifest unavailable (${res.status})`);
+      return res.json() as Promise<AnalyticsManifest>;
+    });
+    manifestPromise.catch(() => { manifestPromise = null; });
+  }
+  return manifestPromise;
+}
+
+// Fetches a single shard; the content hash busts caches whenever the bundle is rebuilt
+export async function loadAnalyticsShard<K extends keyof AnalyticsShards>(name: K): Promise<AnalyticsShards[K]> {
+  const manifest = await loadAnalyticsManifest();
+  const entry = manifest.shards[name];
+  if (!entry) throw new Error(`Analytics shard '${name}' missing from manifest`);
+  const res = await fetch(`${ANALYTICS_BASE}/${entry.path}?v=${entry.hash}`);
+  if (!res.ok) throw new Error(`Analytics shard '${name}' unavailable (${res.status})`);
+  return res.json() as Promise<AnalyticsShards[K]>;
+}